@@ -2,38 +2,51 @@ import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog
 from PIL import Image, ImageTk # Used for displaying images in Tkinter
 import cv2
+import paddle
 from paddleocr import PaddleOCR
-from collections import defaultdict
+from bisect import bisect_left
 import numpy as np
 import os
 import threading # To run video capture and OCR in a separate thread, avoiding freezing UI
+import queue # Hands the newest frame from the capture thread to the OCR worker
+import multiprocessing as mp # Runs PaddleOCR in its own process so it never holds the UI's GIL
+from multiprocessing import shared_memory # Passes frames to the OCR process without pickling them
 import json # For saving data to JSON
 import datetime # For adding timestamps to data
+import functools
+import time
+import sys
+import unicodedata
 
 # --- Dummy implementations for comparision.py and data_operation.py ---
 # In a real scenario, these would be in separate files and handle actual data.
 
 # comparision.py
+# Keyword -> dummy item number, in priority order (earlier entries win when several match)
+ITEM_KEYWORDS = (
+    ("apple", "ITEM001"), ("aapl", "ITEM001"),
+    ("banana", "ITEM002"), ("bana", "ITEM002"),
+    ("orange", "ITEM003"), ("orgn", "ITEM003"),
+)
+
+@functools.lru_cache(maxsize=1024)
 def compare(ocr_text_string):
     """
     Dummy comparison function.
     Returns a dummy item number based on keywords.
+    Expects casefolded text (OCRApp keeps its comparison string casefolded).
     In a real app, this would use more sophisticated matching against an inventory.
     """
     if not isinstance(ocr_text_string, str):
         return "UNKNOWN_ITEM"
     
-    ocr_text_string = ocr_text_string.lower()
-    if "apple" in ocr_text_string or "aapl" in ocr_text_string:
-        return "ITEM001"
-    elif "banana" in ocr_text_string or "bana" in ocr_text_string:
-        return "ITEM002"
-    elif "orange" in ocr_text_string or "orgn" in ocr_text_string:
-        return "ITEM003"
-    else:
-        return "UNKNOWN_ITEM"
+    for keyword, item_num in ITEM_KEYWORDS:
+        if keyword in ocr_text_string:
+            return item_num
+    return "UNKNOWN_ITEM"
 
 # data_operation.py
+@functools.lru_cache(maxsize=1024)
 def get_item_details(item_num):
     """
     Dummy function to get item details based on a dummy item number.
@@ -50,35 +63,276 @@ def get_item_details(item_num):
 # --- End Dummy Implementations ---
 
 
+def cuda_available():
+    """
+    Returns True if the installed Paddle build has CUDA support and sees at least one GPU.
+    CPU-only Paddle builds report False; a missing or broken driver is treated the same way.
+    """
+    try:
+        return paddle.device.is_compiled_with_cuda() and paddle.device.cuda.device_count() > 0
+    except Exception:
+        return False
+
+
 # Path for temporary OCR text file (can be removed if not needed)
 PATH_TEMP_OCR_TEXT = "output_ocr_text.txt"
-# Path for the main dataset JSON file
-DATASET_FILE = "item_dataset.json"
+# Path for the main dataset file, JSON Lines (one item object per line, append-only)
+DATASET_FILE = "item_dataset.jsonl"
+# Frames whose 64x48 thumbnail differs from the last OCR'd frame by less than this
+# mean absolute pixel difference (0-255 scale) are considered unchanged and not re-OCR'd
+OCR_SKIP_DIFF = 2.0
+# Longest image side fed to PaddleOCR; larger frames are downscaled (detector cost scales with area)
+OCR_MAX_SIDE = 960
+# Seconds between checks that the OCR engine process is still alive while waiting on it
+OCR_ENGINE_POLL_INTERVAL = 0.5
+# GStreamer capture pipeline: MJPEG straight from the webcam, decoded once and handed to
+# OpenCV as BGR, with appsink keeping only the newest buffer
+CAMERA_GST_PIPELINE = (
+    "v4l2src device=/dev/video0 ! image/jpeg,width=1280,height=720,framerate=30/1 ! "
+    "jpegdec ! videoconvert ! video/x-raw,format=BGR ! appsink drop=1 max-buffers=1"
+)
+
+
+def open_camera():
+    """
+    Opens the webcam through the GStreamer MJPEG pipeline when OpenCV was built with
+    GStreamer, otherwise falls back to the default backend and requests MJPG frames.
+    """
+    capture = cv2.VideoCapture(CAMERA_GST_PIPELINE, cv2.CAP_GSTREAMER)
+    if capture.isOpened():
+        return capture
+    capture.release()
+    capture = cv2.VideoCapture(0) # 0 for default webcam
+    capture.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*'MJPG'))
+    return capture
+
+
+def load_all(path=DATASET_FILE):
+    """
+    Reads every item saved in a JSON Lines dataset file.
+    Returns an empty list if the file doesn't exist yet.
+    """
+    if not os.path.exists(path):
+        return []
+    with open(path, 'r', encoding='utf-8') as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def _warmup_image():
+    """
+    Returns an OCR_MAX_SIDE square with a few lines of printed text. Unlike a blank
+    frame it yields boxes, so a warm-up pass runs the classifier and recognizer too.
+    """
+    img = np.full((OCR_MAX_SIDE, OCR_MAX_SIDE, 3), 255, dtype=np.uint8)
+    for i, line in enumerate(("BODY WASH 200ml", "Cold Storage", "ITEM 0123456789")):
+        cv2.putText(img, line, (40, 160 + i * 160), cv2.FONT_HERSHEY_SIMPLEX, 2.0, (0, 0, 0), 4)
+    return img
+
+
+def _ocr_engine_main(paddle_kwargs, request_q, result_q):
+    """
+    Entry point of the OCR engine process. Owns the PaddleOCR instance and runs
+    inference on frames that OCREngine writes into a shared memory block.
+    Requests are (shm_name, shape, cls) tuples; None shuts the process down.
+    Reports None on result_q once the model is loaded and warmed up.
+    """
+    try:
+        ocr = PaddleOCR(**paddle_kwargs)
+        # One pass over text at the largest input size, so engine building and first-call
+        # setup of the detector, classifier and recognizer happen at startup instead of
+        # on the first live frame that contains text
+        ocr.ocr(_warmup_image(), cls=paddle_kwargs.get('use_angle_cls', False))
+    except Exception as e:
+        result_q.put(RuntimeError(f"PaddleOCR failed to start: {e}"))
+        return
+    result_q.put(None)
+    shm = None
+    while True:
+        request = request_q.get()
+        if request is None:
+            break
+        shm_name, shape, cls = request
+        # Re-attach only when the parent has replaced the block (frame size changed)
+        if shm is None or shm.name != shm_name:
+            if shm is not None:
+                shm.close()
+            shm = shared_memory.SharedMemory(name=shm_name)
+        img = np.ndarray(shape, dtype=np.uint8, buffer=shm.buf)
+        try:
+            result_q.put(ocr.ocr(img, cls=cls))
+        except Exception as e:
+            result_q.put(RuntimeError(f"PaddleOCR failed: {e}"))
+        del img # Release the view so the block can be closed
+    if shm is not None:
+        shm.close()
+
+
+class OCREngine:
+    """
+    Runs PaddleOCR in a separate process so the ~100-500 ms detector pass never
+    holds this process's GIL and the Tk thread keeps rendering.
+    Frames live in shared memory (see frame_buffer); only the small result list is pickled back.
+    Exposes the same ocr(img, cls) call as PaddleOCR.
+    """
+    def __init__(self, **paddle_kwargs):
+        # 'spawn' avoids forking a process that already runs Tk and worker threads
+        ctx = mp.get_context("spawn")
+        self._request_q = ctx.Queue()
+        self._result_q = ctx.Queue()
+        self._shm = None
+        # Array view over the shared memory block handed out by frame_buffer
+        self._view = None
+        self._process = ctx.Process(target=_ocr_engine_main,
+                                    args=(paddle_kwargs, self._request_q, self._result_q),
+                                    daemon=True)
+        self._process.start()
+        # Block until the engine is warmed up, like constructing PaddleOCR directly would
+        self._get_result()
+
+    def is_alive(self):
+        """
+        Returns True while the engine process is running.
+        """
+        return self._process.is_alive()
+
+    def _get_result(self):
+        """
+        Waits for the engine's next message and returns it, re-raising exceptions it reports.
+        A native crash or the OOM killer ends the process without sending anything back,
+        so the wait is polled and raises RuntimeError once the process has exited.
+        """
+        while True:
+            try:
+                result = self._result_q.get(timeout=OCR_ENGINE_POLL_INTERVAL)
+                break
+            except queue.Empty:
+                if self._process.is_alive():
+                    continue
+            # The process may have sent its message right before exiting
+            try:
+                result = self._result_q.get_nowait()
+                break
+            except queue.Empty:
+                raise RuntimeError(f"OCR engine process exited unexpectedly "
+                                   f"(exit code {self._process.exitcode})") from None
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    def _ensure_shared_buffer(self, nbytes):
+        """
+        Makes sure the shared memory block can hold a frame of nbytes.
+        The block is only reallocated when a larger frame arrives.
+        """
+        if self._shm is not None and self._shm.size >= nbytes:
+            return
+        if self._shm is not None:
+            self._view = None # Drop the view so the old block can be closed
+            self._shm.close()
+            self._shm.unlink()
+        self._shm = shared_memory.SharedMemory(create=True, size=nbytes)
+
+    def frame_buffer(self, shape):
+        """
+        Returns a uint8 array of the given shape backed by the shared memory block.
+        Writing a frame into it (e.g. cv2.cvtColor(..., dst=buf)) and passing it to ocr()
+        means the frame is never copied between this process and the engine.
+        """
+        if self._view is None or self._view.shape != shape:
+            self._ensure_shared_buffer(int(np.prod(shape)))
+            self._view = np.ndarray(shape, dtype=np.uint8, buffer=self._shm.buf)
+        return self._view
+
+    def ocr(self, img, cls=True):
+        """
+        Runs PaddleOCR on an HxWx3 uint8 image in the engine process and returns its result.
+        Blocks the calling thread (not the GIL) until the result arrives.
+        """
+        if img is not self._view:
+            self.frame_buffer(img.shape)[...] = img
+        self._request_q.put((self._shm.name, img.shape, cls))
+        return self._get_result()
+
+    def close(self):
+        """
+        Stops the engine process and frees the shared memory block.
+        """
+        if self._process.is_alive():
+            self._request_q.put(None)
+            self._process.join(timeout=5)
+        if self._shm is not None:
+            self._view = None
+            try:
+                self._shm.close()
+            except BufferError:
+                pass # A frame view is still in use by the OCR worker; freed at exit
+            self._shm.unlink()
+            self._shm = None
+
 
 class OCRProcessor:
     def __init__(self):
-        # Initialize PaddleOCR. Setting use_gpu=False for broader compatibility.
+        # Initialize PaddleOCR in its own process. Runs the detector/recognizer on the GPU
+        # (with TensorRT in FP16) when Paddle sees a CUDA device. If the engine fails to start,
+        # e.g. TensorRT is missing, it is retried on the GPU without TensorRT, then on the CPU.
         # Ensure PaddleOCR model is downloaded or available.
-        self.ocr = PaddleOCR(use_angle_cls=True, lang='en', use_gpu=False)
+        cpu_config = dict(use_gpu=False, use_tensorrt=False, precision='fp32')
+        if cuda_available():
+            device_configs = [dict(use_gpu=True, use_tensorrt=True, precision='fp16'),
+                              dict(use_gpu=True, use_tensorrt=False, precision='fp32'),
+                              cpu_config]
+        else:
+            device_configs = [cpu_config]
+        for i, device_kwargs in enumerate(device_configs):
+            try:
+                self.ocr = OCREngine(use_angle_cls=True, lang='en', **device_kwargs)
+                print(f"OCR engine started with {device_kwargs}")
+                break
+            except RuntimeError as e:
+                if i == len(device_configs) - 1:
+                    raise
+                print(f"OCR engine failed to start with {device_kwargs}, retrying: {e}")
         
-        # Stores frequency of each detected word in the CURRENT LIVE BUFFER
-        self.current_buffer_text_frequencies = defaultdict(int)
-        # Stores the highest confidence encountered for each word in the CURRENT LIVE BUFFER
-        self.current_buffer_best_confidences = {}
+        # Stores [frequency, best confidence, display text] of each detected word in the
+        # CURRENT LIVE BUFFER, keyed by its normalized form, so every detection is a single dict lookup
+        self._stats = {}
+        # Total number of detections accepted into the CURRENT LIVE BUFFER
+        self._total_hits = 0
         # Stores the currently detected item name (from comparison, based on accumulated total OCR)
         self.detected_item = ""
         # Flag to indicate if any text has been detected in the current LIVE BUFFER session
         self.has_detected_text_in_buffer = False
+        # Total OCR string the current detected_item was computed from, None forces a recompare
+        self._last_cmp_input = None
+        # Thumbnail of the last frame sent to PaddleOCR, used to skip unchanged frames
+        self._last_ocr_thumb = None
+        # The angle classifier only runs on every Nth OCR pass; a fixed webcam's text
+        # orientation barely changes between frames
+        self._cls_every = 30
+        self._frame_idx = 0
+        # Live buffer ranking kept sorted incrementally as (-freq, -conf, first_seen, key) tuples,
+        # the texts alone in the same order (joined directly for display),
+        # plus each key's current tuple so it can be found and moved when its stats change
+        self._ranked = []
+        self._ranked_texts = []
+        self._rank_keys = {}
+        # Cached result of get_current_buffer_ocr_string, None when the ranking changed
+        self._buffer_string = None
+        # Guards the live buffer between the OCR worker and the UI thread
+        self._lock = threading.Lock()
 
     def process_ocr_result(self, result):
         """
         Processes the raw OCR result from PaddleOCR, updating text frequencies
         and best confidences for the current live buffer.
+        Returns True if any detection was added to the buffer.
         """
         if not result or not isinstance(result, list):
-            return
+            return False
         
         if result and isinstance(result[0], list):
+            # Validate and clean all detections first, outside the lock
+            detections = []
             for detection in result[0]:
                 if detection is None or len(detection) != 2:
                     continue
@@ -87,30 +341,90 @@ class OCRProcessor:
                     continue
                 
                 text, confidence = text_info
-                text = text.strip()
+                # Normalize once here: NFC for display, plus an interned casefolded key
+                # so case variants of the same word count together
+                text = unicodedata.normalize('NFC', text.strip())
                 if not text:
                     continue
-
-                self.current_buffer_text_frequencies[text] += 1
-                if text not in self.current_buffer_best_confidences or \
-                   confidence > self.current_buffer_best_confidences[text]:
-                    self.current_buffer_best_confidences[text] = confidence
-                
-                self.has_detected_text_in_buffer = True
+                detections.append((sys.intern(text.casefold()), text, confidence))
+
+            if not detections:
+                return False
+
+            # One lock acquisition per frame; each touched text is re-ranked once,
+            # however many times it was detected in this frame
+            with self._lock:
+                stats_map = self._stats
+                touched = {}
+                for key, text, confidence in detections:
+                    stats = stats_map.get(key)
+                    if stats is None:
+                        # The first-seen spelling is the one shown in the buffer
+                        stats = stats_map[key] = [1, confidence, text]
+                    else:
+                        stats[0] += 1
+                        if confidence > stats[1]:
+                            stats[1] = confidence
+                    touched[key] = stats
+                self._total_hits += len(detections)
+                for key, stats in touched.items():
+                    self._rerank(key, stats)
+
+            self.has_detected_text_in_buffer = True
+            return True
+        return False
+
+    def _rerank(self, key, stats):
+        """
+        Moves a single buffer entry to its new position in the live buffer ranking after
+        its frequency or confidence changed. Caller must hold self._lock.
+        """
+        old_rank = self._rank_keys.get(key)
+        if old_rank is None:
+            first_seen = len(self._rank_keys) # Keeps ties in first-detected order
+        else:
+            first_seen = old_rank[2]
+            index = bisect_left(self._ranked, old_rank)
+            del self._ranked[index]
+            del self._ranked_texts[index]
+        new_rank = (-stats[0], -stats[1], first_seen, key)
+        index = bisect_left(self._ranked, new_rank)
+        self._ranked.insert(index, new_rank)
+        self._ranked_texts.insert(index, stats[2])
+        self._rank_keys[key] = new_rank
+        self._buffer_string = None
 
     def run(self, frame, total_ocr_string_for_comparison=""):
         """
         Performs OCR on a single video frame and updates live buffer states.
         Also runs comparison on the total OCR string provided.
+        Returns True if the live buffer or the detected item changed.
         """
-        img = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        result = self.ocr.ocr(np.array(img), cls=True)
-
-        if result:
-            self.process_ocr_result(result)
+        changed = False
+        # Only pay for a PaddleOCR pass when the scene actually changed
+        if self._frame_changed(frame):
+            # Downscale large frames for OCR only; the caller's frame (used by the UI) is untouched
+            h, w = frame.shape[:2]
+            scale = OCR_MAX_SIDE / max(h, w)
+            if scale < 1:
+                frame = cv2.resize(frame, (int(w * scale), int(h * scale)), interpolation=cv2.INTER_AREA)
+            # Convert straight into the engine's persistent shared frame buffer,
+            # so no per-frame RGB array is allocated or copied
+            img = self.ocr.frame_buffer(frame.shape)
+            cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=img)
+            cls = self._frame_idx % self._cls_every == 0
+            self._frame_idx += 1
+            result = self.ocr.ocr(img, cls=cls)
+
+            if result:
+                changed = self.process_ocr_result(result)
             
         # Run comparison logic on the combined OCR string (from OCRApp)
-        # This string represents ALL OCR attempts for the current item
+        # This string represents ALL OCR attempts for the current item.
+        # It only changes when an attempt is added, so skip the comparison otherwise.
+        if total_ocr_string_for_comparison == self._last_cmp_input:
+            return changed
+        self._last_cmp_input = total_ocr_string_for_comparison
         if total_ocr_string_for_comparison:
             detected_item_num = compare(total_ocr_string_for_comparison)
             item_details = get_item_details(detected_item_num)
@@ -120,34 +434,47 @@ class OCRProcessor:
                 self.detected_item = "Item not recognized"
         else:
             self.detected_item = "No OCR collected for comparison yet" # Indicate no basis for comparison
+        return True
 
+    def _frame_changed(self, frame):
+        """
+        Returns True if the frame differs enough from the last OCR'd frame to be worth
+        another OCR pass, and remembers it as the new reference in that case.
+        """
+        thumb = cv2.resize(frame, (64, 48), interpolation=cv2.INTER_AREA).astype(np.int16)
+        if self._last_ocr_thumb is not None and \
+           np.abs(thumb - self._last_ocr_thumb).mean() < OCR_SKIP_DIFF:
+            return False
+        self._last_ocr_thumb = thumb
+        return True
 
     def get_current_buffer_ocr_string(self):
         """
         Returns a single string of unique OCR texts from the current live buffer,
         sorted by frequency and then confidence.
+        The ranking is maintained incrementally, so this only joins it when it changed.
         """
-        if not self.current_buffer_text_frequencies:
+        if not self._total_hits: # Empty buffer, nothing to lock or join
             return ""
-
-        results_list = []
-        for text, freq in self.current_buffer_text_frequencies.items():
-            conf = self.current_buffer_best_confidences.get(text, 0.0)
-            results_list.append((text, freq, conf))
-
-        # Sort by frequency (desc) then confidence (desc)
-        sorted_unique_texts = sorted(results_list, key=lambda x: (-x[1], -x[2]))
-        
-        # Return only the text strings, joined by spaces
-        return " ".join([text for text, freq, conf in sorted_unique_texts])
+        with self._lock:
+            if self._buffer_string is None:
+                self._buffer_string = " ".join(self._ranked_texts)
+            return self._buffer_string
 
     def reset_buffer(self):
         """
-        Resets only the current live OCR buffer (text_frequencies, best_confidences).
+        Resets only the current live OCR buffer (per-text stats and the ranking).
         """
-        self.current_buffer_text_frequencies.clear()
-        self.current_buffer_best_confidences.clear()
+        with self._lock:
+            self._stats.clear()
+            self._total_hits = 0
+            self._ranked.clear()
+            self._ranked_texts.clear()
+            self._rank_keys.clear()
+            self._buffer_string = None
         self.has_detected_text_in_buffer = False
+        self._last_ocr_thumb = None # OCR the current scene again for the fresh buffer
+        self._frame_idx = 0 # ...starting with an angle-classified pass
         print("Live OCR buffer reset.")
 
     def reset_all(self):
@@ -156,11 +483,18 @@ class OCRProcessor:
         """
         self.reset_buffer()
         self.detected_item = ""
+        self._last_cmp_input = None
         # Remove the temporary text file if it exists
         if os.path.exists(PATH_TEMP_OCR_TEXT):
             os.remove(PATH_TEMP_OCR_TEXT)
         print("OCRProcessor fully reset. Ready for a new item.")
 
+    def close(self):
+        """
+        Shuts down the OCR engine process.
+        """
+        self.ocr.close()
+
 
 # --- Tkinter Application Class ---
 class OCRApp:
@@ -173,6 +507,13 @@ class OCRApp:
         "Hazardous Material Storage"
     ]
 
+    # Widget configurations for the info labels, applied by update_info_labels
+    DETECTED_IDLE = {"text": "Waiting for detection...", "background": "#e0e0e0"}
+    DETECTED_ACTIVE_FMT = "Detected: {}"
+    DETECTED_ACTIVE_BACKGROUND = "#a0e0a0"
+    LIVE_BUFFER_IDLE = {"text": "No text yet..."}
+    TOTAL_OCR_IDLE = {"text": "No total OCR yet..."}
+
     def __init__(self, window, window_title="Real-time OCR Item Detection"):
         self.window = window
         self.window.title(window_title)
@@ -181,17 +522,41 @@ class OCRApp:
 
         # Initialize the OCR processor and webcam
         self.ocr_processor = OCRProcessor()
-        self.video_capture = cv2.VideoCapture(0) # 0 for default webcam
+        self.video_capture = open_camera()
 
         # Check if webcam opened successfully
         if not self.video_capture.isOpened():
             messagebox.showerror("Camera Error", "Failed to open webcam. Please ensure it's connected and not in use.")
+            self.ocr_processor.close()
             self.window.destroy()
             return
-
-        self.is_processing_frame = False # Flag to prevent multiple OCR threads on same frame
+        # Keep only the newest frame in the driver queue to cut capture latency
+        self.video_capture.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+
+        # Size-1 hand-off queue: the capture thread always replaces the pending frame with the newest one,
+        # so the single OCR worker never falls behind on stale frames.
+        self._frame_q = queue.Queue(maxsize=1)
+        # Newest frame from the capture thread (guarded by _frame_lock) and the last one displayed
+        self._latest_frame = None
+        self._frame_lock = threading.Lock()
+        self._shown_frame = None
+        self._running = True
+        # Options last applied to each info widget by _configure, to skip no-op Tk calls
+        self._applied_config = {}
+        # Display buffers, (re)built by _ensure_display_buffers when the label size changes
+        self._display_size = None
+        self._resized = None
+        self._rgba_buf = None
+        self._pil_img = None
+        self._photo = None
         # This list will store each OCR "attempt" as a separate string for the current item
         self.current_item_ocr_attempts_list = [] 
+        # The attempts joined by spaces (used for comparison) and its truncated display form,
+        # both updated only when an attempt is added or the item is finalized
+        self._total_ocr_joined = ""
+        self._total_ocr_display = ""
+        # Casefolded copy of _total_ocr_joined, passed to compare() so it never re-normalizes
+        self._total_ocr_key = ""
 
         # Setup GUI elements
         self.create_widgets()
@@ -199,11 +564,21 @@ class OCRApp:
         # Setup keyboard bindings
         self.setup_keyboard_bindings()
 
+        # The OCR worker posts this virtual event whenever it changed what the labels show
+        self.window.bind('<<OCRUpdated>>', self._on_ocr_updated)
+
+        # Single long-lived OCR worker; runs PaddleOCR as fast as it can, no faster
+        self._ocr_worker = threading.Thread(target=self._ocr_loop, daemon=True)
+        self._ocr_worker.start()
+        # Capture thread; keeps webcam reads off the Tk thread
+        self._capture_thread = threading.Thread(target=self._capture_loop, daemon=True)
+        self._capture_thread.start()
+
         # Start video stream update. 'delay' controls update frequency.
         self.delay = 10 # milliseconds, updates every 10ms (approx 100 FPS)
         self.update_video_feed()
-        # Start updating the detected item label and accumulated text labels
-        self.update_info_labels() 
+        # Render the initial state of the detected item label and accumulated text labels
+        self.update_info_labels()
 
         # Handle window closing to release webcam resources
         self.window.protocol("WM_DELETE_WINDOW", self.on_closing)
@@ -357,82 +732,136 @@ class OCRApp:
 
     def update_video_feed(self):
         """
-        Captures a frame from the webcam, displays it, and triggers OCR processing.
+        Displays the newest frame captured by the capture thread.
         """
-        ret, frame = self.video_capture.read()
-        if ret:
+        with self._frame_lock:
+            frame = self._latest_frame
+        # Skip the redraw if the capture thread hasn't produced a new frame since the last tick
+        if frame is not None and frame is not self._shown_frame:
+            self._shown_frame = frame
+
             # Get current size of the video_label to resize frame dynamically
             label_width = self.video_label.winfo_width()
             label_height = self.video_label.winfo_height()
 
-            if label_width > 0 and label_height > 0:
-                frame = cv2.resize(frame, (label_width, label_height))
-
-            # Convert OpenCV image (BGR) to RGBA for Pillow, then to PhotoImage for Tkinter
-            cv2image = cv2.cvtColor(frame, cv2.COLOR_BGR2RGBA)
-            self.current_photo = ImageTk.PhotoImage(image=Image.fromarray(cv2image))
-            self.video_label.imgtk = self.current_photo # Keep a reference to prevent garbage collection
-            self.video_label.configure(image=self.current_photo)
-
-            # Only run OCR on a new frame if previous OCR thread is not still processing
-            if not self.is_processing_frame:
-                self.is_processing_frame = True
-                # Pass the combined OCR string for comparison to OCRProcessor
-                # Join the list elements to form a single string for comparison
-                total_ocr_for_comparison_str = " ".join(self.current_item_ocr_attempts_list)
-                threading.Thread(target=self._run_ocr_on_frame, 
-                                 args=(frame.copy(), total_ocr_for_comparison_str)).start()
+            if label_width <= 0 or label_height <= 0:
+                # Label not laid out yet, show the frame at its native size
+                label_height, label_width = frame.shape[:2]
+            self._ensure_display_buffers(label_width, label_height)
+
+            # Resize and convert BGR -> RGBA straight into the preallocated buffers,
+            # then push the shared-memory PIL image into the existing PhotoImage
+            cv2.resize(frame, (label_width, label_height), dst=self._resized)
+            cv2.cvtColor(self._resized, cv2.COLOR_BGR2RGBA, dst=self._rgba_buf)
+            self._photo.paste(self._pil_img)
         
         # Schedule the next video feed update
         self.window.after(self.delay, self.update_video_feed)
 
-    def _run_ocr_on_frame(self, frame_copy, total_ocr_for_comparison):
+    def _capture_loop(self):
         """
-        Internal method to run OCR on a frame. Executed in a separate thread.
+        Capture loop. Reads the webcam continuously, publishes the newest frame for the
+        video feed and hands it to the OCR worker. Executed in a daemon thread.
         """
-        try:
-            self.ocr_processor.run(frame_copy, total_ocr_for_comparison)
-        finally:
-            self.is_processing_frame = False # Reset flag after processing
+        while self._running:
+            ret, frame = self.video_capture.read()
+            if not ret:
+                time.sleep(0.01) # Avoid spinning if the camera stops delivering frames
+                continue
+            with self._frame_lock:
+                self._latest_frame = frame
+            # Hand the newest frame to the OCR worker, dropping any frame it hasn't picked up yet
+            try:
+                self._frame_q.get_nowait()
+            except queue.Empty:
+                pass
+            self._frame_q.put(frame)
+
+    def _ensure_display_buffers(self, width, height):
+        """
+        Allocates the resize/RGBA buffers and the PhotoImage for the given display size.
+        Does nothing unless the label size actually changed since the last call.
+        """
+        if self._display_size == (width, height):
+            return
+        self._display_size = (width, height)
+        self._resized = np.empty((height, width, 3), np.uint8)
+        self._rgba_buf = np.empty((height, width, 4), np.uint8)
+        # frombuffer shares memory with _rgba_buf, so converting into the buffer updates the image
+        self._pil_img = Image.frombuffer('RGBA', (width, height), self._rgba_buf, 'raw', 'RGBA', 0, 1)
+        self._photo = ImageTk.PhotoImage(self._pil_img)
+        self.video_label.imgtk = self._photo # Keep a reference to prevent garbage collection
+        self.video_label.configure(image=self._photo)
+
+    def _ocr_loop(self):
+        """
+        OCR worker loop. Blocks until the capture thread hands off a frame, runs OCR on it, and repeats.
+        Executed in a single daemon thread for the lifetime of the app.
+        """
+        while True:
+            frame = self._frame_q.get()
+            # Pass the combined OCR string (all attempts, precomputed) for comparison to OCRProcessor
+            try:
+                changed = self.ocr_processor.run(frame, self._total_ocr_key)
+            except Exception as e:
+                if not self.ocr_processor.ocr.is_alive():
+                    print(f"OCR stopped: {e}")
+                    return
+                print(f"Error running OCR on frame: {e}")
+                continue
+            if changed:
+                # Ask the Tk thread to re-render the labels; queued behind pending UI events
+                try:
+                    self.window.event_generate('<<OCRUpdated>>', when='tail')
+                except (tk.TclError, RuntimeError):
+                    return # Window was destroyed
+
+    def _on_ocr_updated(self, event=None):
+        """Handles <<OCRUpdated>> from the OCR worker by refreshing labels and buttons."""
+        self.update_info_labels()
 
     def update_info_labels(self):
         """
-        Updates the detected item label, live buffer text, and total OCR text periodically.
-        Also manages button states.
+        Updates the detected item label, live buffer text, and total OCR text.
+        Also manages button states. Called on <<OCRUpdated>> and after user actions.
         """
         # Update detected item label
-        if self.ocr_processor.detected_item:
-            self.detected_item_label.config(text=f"Detected: {self.ocr_processor.detected_item}", background="#a0e0a0")
+        detected_item = self.ocr_processor.detected_item
+        if detected_item:
+            self._configure(self.detected_item_label,
+                            text=self.DETECTED_ACTIVE_FMT.format(detected_item),
+                            background=self.DETECTED_ACTIVE_BACKGROUND)
         else:
-            self.detected_item_label.config(text="Waiting for detection...", background="#e0e0e0")
+            self._configure(self.detected_item_label, **self.DETECTED_IDLE)
 
         # Update live buffer label
         live_buffer_text = self.ocr_processor.get_current_buffer_ocr_string()
         if live_buffer_text:
-            self.live_buffer_label.config(text=live_buffer_text)
-            self.add_to_item_button.config(state=tk.NORMAL) # Enable "Add to Item" if buffer has text
-            self.save_temp_ocr_button.config(state=tk.NORMAL) # Enable "Save Live Buffer"
+            self._configure(self.live_buffer_label, text=live_buffer_text)
+            self._configure(self.add_to_item_button, state=tk.NORMAL) # Enable "Add to Item" if buffer has text
+            self._configure(self.save_temp_ocr_button, state=tk.NORMAL) # Enable "Save Live Buffer"
         else:
-            self.live_buffer_label.config(text="No text yet...")
-            self.add_to_item_button.config(state=tk.DISABLED) # Disable "Add to Item"
-            self.save_temp_ocr_button.config(state=tk.DISABLED) # Disable "Save Live Buffer"
+            self._configure(self.live_buffer_label, **self.LIVE_BUFFER_IDLE)
+            self._configure(self.add_to_item_button, state=tk.DISABLED) # Disable "Add to Item"
+            self._configure(self.save_temp_ocr_button, state=tk.DISABLED) # Disable "Save Live Buffer"
 
         # Update total OCR label
         if self.current_item_ocr_attempts_list:
-            # Show a truncated version of the joined attempts for display
-            joined_attempts_display = " ".join(self.current_item_ocr_attempts_list)
-            if len(joined_attempts_display) > 100: # Truncate for display purposes
-                display_text = joined_attempts_display[:97] + "..."
-            else:
-                display_text = joined_attempts_display
-            self.total_ocr_label.config(text=display_text)
-            self.finalize_item_button.config(state=tk.NORMAL) # Enable "Finalize Item" if total OCR exists
+            # Show the truncated version of the joined attempts, precomputed when an attempt is added
+            self._configure(self.total_ocr_label, text=self._total_ocr_display)
+            self._configure(self.finalize_item_button, state=tk.NORMAL) # Enable "Finalize Item" if total OCR exists
         else:
-            self.total_ocr_label.config(text="No total OCR yet...")
-            self.finalize_item_button.config(state=tk.DISABLED) # Disable "Finalize Item"
+            self._configure(self.total_ocr_label, **self.TOTAL_OCR_IDLE)
+            self._configure(self.finalize_item_button, state=tk.DISABLED) # Disable "Finalize Item"
 
-        # Schedule the next update
-        self.window.after(200, self.update_info_labels) # Update every 200ms
+    def _configure(self, widget, **options):
+        """
+        Applies options to a widget only when they differ from what was last applied,
+        so unchanged labels and buttons cost no Tcl round-trip.
+        """
+        if self._applied_config.get(widget) != options:
+            self._applied_config[widget] = options
+            widget.config(**options)
 
     def _add_current_ocr_to_item(self):
         """
@@ -446,6 +875,16 @@ class OCRApp:
 
         # Append the current buffer text as a new attempt
         self.current_item_ocr_attempts_list.append(current_buffer_text)
+        if self._total_ocr_joined:
+            self._total_ocr_joined += " " + current_buffer_text
+            self._total_ocr_key += " " + current_buffer_text.casefold()
+        else:
+            self._total_ocr_joined = current_buffer_text
+            self._total_ocr_key = current_buffer_text.casefold()
+        if len(self._total_ocr_joined) > 100: # Truncate for display purposes
+            self._total_ocr_display = self._total_ocr_joined[:97] + "..."
+        else:
+            self._total_ocr_display = self._total_ocr_joined
         
         self.ocr_processor.reset_buffer() # Clear the live buffer
         messagebox.showinfo("OCR Added", "Live OCR text added as a new attempt to current item.")
@@ -567,25 +1006,17 @@ class OCRApp:
             }
             
             try:
-                # Read existing data
-                if os.path.exists(DATASET_FILE) and os.path.getsize(DATASET_FILE) > 0:
-                    with open(DATASET_FILE, 'r', encoding='utf-8') as f:
-                        dataset = json.load(f)
-                else:
-                    dataset = [] # Initialize as empty list if file doesn't exist or is empty
-                
-                # Append new item data
-                dataset.append(item_data)
-                
-                # Write updated data back to file
-                with open(DATASET_FILE, 'w', encoding='utf-8') as f:
-                    json.dump(dataset, f, ensure_ascii=False, indent=4)
+                # Append the new item as one line; existing items are never re-read or rewritten
+                with open(DATASET_FILE, 'a', encoding='utf-8') as f:
+                    f.write(json.dumps(item_data, ensure_ascii=False) + "\n")
                 
                 messagebox.showinfo("Success", f"'{item_details['item_name']}' data saved to {DATASET_FILE}. Ready for new item.")
                 self.ocr_processor.reset_all() # Reset OCR data for the next item
                 self.current_item_ocr_attempts_list = [] # Reset the list of attempts for the next item
-            except json.JSONDecodeError:
-                messagebox.showerror("Error", f"Could not read existing {DATASET_FILE}. File might be corrupted.")
+                self._total_ocr_joined = ""
+                self._total_ocr_display = ""
+                self._total_ocr_key = ""
+                self.update_info_labels() # Show the cleared state immediately
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to save item data: {e}")
         else:
@@ -622,8 +1053,11 @@ class OCRApp:
         Handles the window closing event, releasing webcam resources.
         """
         if messagebox.askokcancel("Quit", "Do you want to quit the application?"):
+            self._running = False
+            self._capture_thread.join(timeout=1) # Let the capture thread finish its last read
             if self.video_capture.isOpened():
                 self.video_capture.release() # Release webcam
+            self.ocr_processor.close() # Stop the OCR engine process
             self.window.destroy() # Close Tkinter window
 
 
@@ -1,41 +1,169 @@
-import json
+import glob
+import mmap
+import os
+from functools import lru_cache
+from itertools import chain
+
+import orjson
 
 # ======= USER INPUT: Provide your file path here =======
-input_path = "item_dataset.json"  # ⬅️ Replace with your actual path
-output_path = "converted_chat_dataset.json"
+input_path = "item_dataset.jsonl"  # ⬅️ Replace with your actual path (.jsonl from Main.py, or a legacy .json array)
+output_prefix = "converted_chat_dataset"  # JSON Lines shards <prefix>-00000.jsonl, ..., one record per OCR line,
+                                          # listed in <prefix>-info.json
+records_per_shard = 10000  # Start a new shard after this many records
+# Record shape: "sharegpt" -> {"conversations": [human, gpt]} (what the Llama notebook loads)
+#               "prompt_completion" -> {"prompt": ..., "completion": ...}
+output_format = "sharegpt"
 # ========================================================
 
-# Load the original dataset
-with open(input_path, "r") as f:
-    data = json.load(f)
+# Instruction placed in front of every OCR line in the user turn
+PROMPT_PREFIX = (
+    "Extract only the company name, item name, category, and storage recommendation "
+    "from the OCR text below. Respond concisely in JSON format without any explanation or extra text.\n\n"
+)
+OUTPUT_FORMATS = ("prompt_completion", "sharegpt")
+# Output buffer size; the many small per-line writes reach the OS about once per MiB
+WRITE_BUFFER_SIZE = 1 << 20
+# Output files are written under their final name plus this suffix, then moved into place
+TMP_SUFFIX = ".tmp"
+
+
+@lru_cache(maxsize=None)
+def assistant_json(company_name, item_name, category, storage_recommendation):
+    """
+    Serializes the expected assistant answer. Cached, since entries for the same
+    product (e.g. several OCR sessions of one SKU) share identical metadata.
+    """
+    assistant_response = {
+        "company_name": company_name,
+        "item_name": item_name,
+        "category": category,
+        "storage_recommendation": storage_recommendation
+    }
+    # Compact JSON: indentation only adds whitespace tokens to the training target
+    return orjson.dumps(assistant_response).decode()
+
+
+def convert_entry(entry):
+    """
+    Converts one dataset entry into one (prompt, completion) pair per OCR line.
+    Pairs are plain tuples, which are cheaper to build than dicts; to_record gives
+    them the output_format shape when written.
+    """
+    # The expected answer is the same for every OCR line of an entry, so serialize it once
+    assistant_value = assistant_json(entry["company_name"], entry["item_name"],
+                                     entry["category"], entry["storage_recommendation"])
+    return [(PROMPT_PREFIX + ocr_text, assistant_value) for ocr_text in entry["ocr_text_list"]]
+
+
+def to_record(prompt, completion):
+    """Builds the output record for one pair, in output_format."""
+    if output_format == "sharegpt":
+        return {"conversations": [{"from": "human", "value": prompt},
+                                  {"from": "gpt", "value": completion}]}
+    return {"prompt": prompt, "completion": completion}
+
+
+def iter_entries():
+    """
+    Yields the entries of input_path. JSON Lines input is parsed one line at a
+    time, so memory stays at one entry however large the file grows.
+    """
+    if input_path.endswith(".jsonl"):
+        with open(input_path, "rb") as f:
+            for line in f:
+                if line.strip():
+                    yield orjson.loads(line)
+        return
+
+    # A JSON array has to be parsed whole. The file is memory-mapped and orjson parses
+    # the mapped bytes directly, so there is no read() copy and no text decode step.
+    with open(input_path, "rb") as f, \
+         mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        if hasattr(mapped, "madvise"): # Unix only: hint a single sequential pass
+            mapped.madvise(mmap.MADV_SEQUENTIAL)
+        with memoryview(mapped) as view:
+            data = orjson.loads(view)
+    yield from data
+
+
+def iter_pairs(entries):
+    """Yields every entry's (prompt, completion) pairs, in order."""
+    return chain.from_iterable(map(convert_entry, entries))
+
+
+def shard_path(index):
+    """Path of the shard with the given index."""
+    return f"{output_prefix}-{index:05d}.jsonl"
+
+
+def info_path():
+    """Path of the index file listing the shards and their record counts."""
+    return f"{output_prefix}-info.json"
+
+
+def write_shards(pairs):
+    """
+    Writes pairs as JSON Lines records, starting a new shard file every records_per_shard
+    records, so downstream loaders can read and tokenize shards in parallel.
+    Each shard is written to its path plus TMP_SUFFIX; if conversion fails, those
+    files are removed again and the error is re-raised.
+    Returns a list of (shard path, record count).
+    """
+    shards = []
+    f = None
+    try:
+        for prompt, completion in pairs:
+            if f is None or shards[-1][1] == records_per_shard:
+                if f is not None:
+                    f.close()
+                path = shard_path(len(shards))
+                f = open(path + TMP_SUFFIX, "wb", buffering=WRITE_BUFFER_SIZE)
+                shards.append([path, 0])
+            f.write(orjson.dumps(to_record(prompt, completion)) + b"\n")
+            shards[-1][1] += 1
+        if f is not None:
+            f.close()
+    except BaseException:
+        if f is not None:
+            f.close()
+        for path, _ in shards:
+            os.remove(path + TMP_SUFFIX)
+        raise
+    return [(path, count) for path, count in shards]
+
 
-# Process each OCR line as a separate conversation
-chat_data = []
+def main():
+    if output_format not in OUTPUT_FORMATS:
+        raise ValueError(f"output_format must be one of {OUTPUT_FORMATS}, got {output_format!r}")
 
-for entry in data:
-    for ocr_text in entry["ocr_text_list"]:
-        conversation = []
+    # Process each OCR line as a separate record and stream it straight to the
+    # output shards, so the converted dataset is never held in memory as a whole
+    shards = write_shards(iter_pairs(iter_entries()))
 
-        user_prompt = (
-            "Extract only the company name, item name, category, and storage recommendation "
-            "from the OCR text below. Respond concisely in JSON format without any explanation or extra text.\n\n"
-            + ocr_text
-        )
+    dataset_info = {
+        "format": output_format,
+        "total_records": sum(count for _, count in shards),
+        "shards": [{"file": os.path.basename(path), "records": count} for path, count in shards],
+    }
+    with open(info_path() + TMP_SUFFIX, "wb") as f:
+        f.write(orjson.dumps(dataset_info, option=orjson.OPT_INDENT_2))
 
-        assistant_response = {
-            "company_name": entry["company_name"],
-            "item_name": entry["item_name"],
-            "category": entry["category"],
-            "storage_recommendation": entry["storage_recommendation"]
-        }
+    # Every file of this run is complete, so only now replace the previous dataset.
+    # A run that fails earlier leaves the previous shards and index untouched
+    for path, _ in shards:
+        os.replace(path + TMP_SUFFIX, path)
+    os.replace(info_path() + TMP_SUFFIX, info_path())
 
-        conversation.append({"from": "human", "value": user_prompt})
-        conversation.append({"from": "gpt", "value": json.dumps(assistant_response, indent=4)})
+    # Remove shards left over from a previous, larger run so a glob over the output
+    # only matches this run's files
+    written = {path for path, _ in shards}
+    for stale in glob.glob(f"{output_prefix}-[0-9][0-9][0-9][0-9][0-9].jsonl"):
+        if stale not in written:
+            os.remove(stale)
 
-        chat_data.append(conversation)
+    print("AMAAN AHMAD 22BEC1179")
 
-# Save the chat-style dataset
-with open(output_path, "w") as f:
-    json.dump(chat_data, f, indent=2)
 
-print("AMAAN AHMAD 22BEC1179")
+if __name__ == "__main__":
+    main()